@@ -1,76 +1,268 @@
 #!/usr/bin/env python3
 
 import os
+import socket
 import requests
-import json
+import orjson
 import time
 import logging
-from prometheus_client import start_http_server, Gauge
+import functools
+import threading
+import websocket
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from prometheus_client import start_http_server, REGISTRY
+from prometheus_client.core import GaugeMetricFamily
 
 NIMIQ_NODE_URL  = os.getenv('NIMIQ_NODE_URL', 'http://node:8648')
 NIMIQ_NETWORK   = os.getenv('NIMIQ_NETWORK', 'testnet')
 FACUET_URL      = os.getenv('FACUET_URL','https://faucet.pos.nimiq-testnet.com/tapit')
 PROMETHEUS_PORT = os.getenv('PROMETHEUS_PORT', 8000)
+NIMIQ_WS_URL    = os.getenv('NIMIQ_WS_URL', NIMIQ_NODE_URL.replace('http', 'ws', 1).rstrip('/') + '/ws')
+CONSENSUS_CONFIRMATIONS = max(1, int(os.getenv('CONSENSUS_CONFIRMATIONS', '2')))
+CONSENSUS_INTERVAL      = float(os.getenv('CONSENSUS_INTERVAL', '1.5'))
+
+MONITOR_INTERVAL = 30  # Seconds between validator metric updates
+HEAD_BLOCK_TIMEOUT = 60  # Seconds without a head block before falling back to polling
+
+class NodeAdapter(HTTPAdapter):
+    # Small JSON-RPC frames should not wait on Nagle, idle pooled sockets are kept alive by TCP.
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+# Shared HTTP session so the node connection is kept alive between calls.
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+# Requests to the node are retried inside the transport with exponential backoff.
+SESSION.mount(NIMIQ_NODE_URL, NodeAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["POST"]),
+)))
+REQUEST_TIMEOUT = (3, 10)  # (connect, read) in seconds
+FAUCET_TIMEOUT = (3, 15)
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Worker threads to run independent node requests concurrently.
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Minimal gap between back-to-back node requests to not overload the node.
+_MIN_GAP = 0.05
+_last_call = 0.0
 
 # Prometheus Metrics
-ACTIVATED_AMOUNT = Gauge('nimiq_activated_amount', 'Amount activated', ['address'])
-VALIDATOR_ACTIVE = Gauge('nimiq_validator_active', 'Validator active')
-EPOCH_NUMBER = Gauge('nimiq_epoch_number', 'Epoch number')
-CURRENT_BALANCE = Gauge('nimiq_current_balance', 'Current balance')
-TOTAL_STAKE = Gauge('nimiq_validator_total_stake', 'Total amount of stake')
-CURRENT_STAKERS = Gauge('nimiq_validator_current_stakers', 'Current amount of stakers')
+# Metrics are served from a snapshot that is replaced as a whole,
+# so a scrape never sees a half updated tick.
+_SNAPSHOT = {
+    'validator_active': 0,
+    'epoch_number': 0,
+    'current_balance': 0,
+    'total_stake': 0,
+    'current_stakers': 0,
+    'activated_amount': {},  # address -> number of activations
+}
+_SNAPSHOT_LOCK = threading.Lock()
+
+def publish(**values):
+    global _SNAPSHOT
+    with _SNAPSHOT_LOCK:
+        snapshot = dict(_SNAPSHOT)
+        snapshot.update(values)
+        _SNAPSHOT = snapshot
+
+def publish_activation(address):
+    global _SNAPSHOT
+    with _SNAPSHOT_LOCK:
+        activated = dict(_SNAPSHOT['activated_amount'])
+        activated[address] = activated.get(address, 0) + 1
+        _SNAPSHOT = dict(_SNAPSHOT, activated_amount=activated)
+
+class NimiqCollector:
+    METRICS = (
+        ('nimiq_validator_active', 'Validator active', 'validator_active'),
+        ('nimiq_epoch_number', 'Epoch number', 'epoch_number'),
+        ('nimiq_current_balance', 'Current balance', 'current_balance'),
+        ('nimiq_validator_total_stake', 'Total amount of stake', 'total_stake'),
+        ('nimiq_validator_current_stakers', 'Current amount of stakers', 'current_stakers'),
+    )
+
+    def collect(self):
+        snapshot = _SNAPSHOT
+        activated = GaugeMetricFamily('nimiq_activated_amount', 'Amount activated', labels=['address'])
+        for address, amount in snapshot['activated_amount'].items():
+            activated.add_metric([str(address)], amount)
+        yield activated
+        for name, documentation, key in self.METRICS:
+            yield GaugeMetricFamily(name, documentation, value=snapshot[key])
+
+REGISTRY.register(NimiqCollector())
 
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s — %(message)s',
                     datefmt='%Y-%m-%d_%H:%M:%S',
                     handlers=[logging.StreamHandler()])
+log = logging.getLogger(__name__)
 
-def nimiq_request(method, params=None, retries=3, delay=5):
-    while retries > 0:
-        try:
-            response = requests.post(NIMIQ_NODE_URL, json={
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": method,
-                "params": params or [],
-            })
-            response.raise_for_status()  # Raises an HTTPError if the HTTP request returned an unsuccessful status code
-            result = response.json().get('result', {})
-            time.sleep(0.5) # Wait for 0.5 second to not overload the node.
-            if result is None:
-                raise ValueError("No result in response")
-            return result
+class ConsensusLost(Exception):
+    pass
 
-        except requests.exceptions.RequestException as err:
-            retries -= 1
-            logging.error(f"Error: {err}. Retrying in {delay} seconds. Retries left: {retries}")
-            time.sleep(delay)
-    logging.error("Request failed after multiple retries.")
-    return None
+# Phrases in JSON-RPC errors the node returns while it is out of sync, e.g. "Node not in sync".
+OUT_OF_SYNC_PHRASES = ("consensus", "sync")
+
+def _check_consensus_error(body):
+    # Raises ConsensusLost if the node rejected the call because it is out of sync.
+    error = body.get('error')
+    if not isinstance(error, dict):
+        return
+    text = f"{error.get('message', '')} {error.get('data', '')}".lower()
+    if any(phrase in text for phrase in OUT_OF_SYNC_PHRASES):
+        raise ConsensusLost(error.get('message'))
+
+def _throttle():
+    global _last_call
+    gap = _MIN_GAP - (time.monotonic() - _last_call)
+    if gap > 0:
+        time.sleep(gap)
+    _last_call = time.monotonic()
+
+# Methods polled with the same params every tick, only their request bodies are cached.
+POLLED_METHODS = frozenset(["isConsensusEstablished", "getEpochNumber", "getValidatorByAddress", "getAccountByAddress"])
+
+def _encode(method, params):
+    return orjson.dumps({
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": method,
+        "params": list(params),
+    })
+
+@functools.lru_cache(maxsize=8)
+def _encoded_polled(method, params):
+    return _encode(method, params)
+
+def _request_body(method, params):
+    params = params or []
+    if method in POLLED_METHODS:
+        return _encoded_polled(method, tuple(params))
+    return _encode(method, params)
+
+@functools.lru_cache(maxsize=4)
+def _encoded_batch(calls):
+    # The monitoring batch is identical every tick, encode it only once.
+    return orjson.dumps([{
+        "jsonrpc": "2.0",
+        "id": i,
+        "method": method,
+        "params": list(params),
+    } for i, (method, params) in enumerate(calls)])
+
+def nimiq_request(method, params=None, throttle=True):
+    try:
+        if throttle:
+            _throttle()
+        response = SESSION.post(NIMIQ_NODE_URL, data=_request_body(method, params),
+                                headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()  # Raises an HTTPError if the HTTP request returned an unsuccessful status code
+        body = orjson.loads(response.content)
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as err:
+        log.error("Request %s failed after retries: %s", method, err)
+        return None
+    _check_consensus_error(body)
+    if 'error' in body:
+        log.error("Request %s returned an error: %s", method, body['error'])
+        return None
+    result = body.get('result', {})
+    if result is None:
+        raise ValueError("No result in response")
+    return result
+
+def nimiq_request_batch(calls):
+    # Sends all (method, params) calls in a single JSON-RPC batch, results are returned in call order.
+    data = _encoded_batch(tuple((method, tuple(params or ())) for method, params in calls))
+    try:
+        _throttle()
+        response = SESSION.post(NIMIQ_NODE_URL, data=data, headers=JSON_HEADERS, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        body = orjson.loads(response.content)
+    except (requests.exceptions.RequestException, ValueError) as err:
+        log.error("Batch request failed: %s. Falling back to single requests.", err)
+        body = None
+    if not isinstance(body, list):
+        # Node does not support batching, issue the calls concurrently instead.
+        # These skip the throttle on purpose: _throttle is not thread safe, and spacing
+        # them out would serialize the calls again. They replace a single batch request.
+        return list(EXECUTOR.map(lambda call: nimiq_request(*call, throttle=False), calls))
+    results = [None] * len(calls)
+    for item in body:
+        _check_consensus_error(item)
+        if 'error' in item:
+            log.error("Batch request returned an error: %s", item['error'])
+            continue
+        if item.get('id') in range(len(calls)):
+            results[item['id']] = item.get('result')
+    return results
+
+@dataclass(frozen=True)
+class Keys:
+    sigkey: str
+    votekey: str
+    address_private: str
+
+def adaptive_sleep(state, value, floor=1, ceiling=60):
+    # Doubles the wait while the observed value stays the same, resets to the floor once it changes.
+    if 'interval' in state and value == state.get('last'):
+        state['interval'] = min(state['interval'] * 2, ceiling)
+    else:
+        state['interval'] = floor
+    state['last'] = value
+    interval = state['interval']
+    time.sleep(interval + random.uniform(0, 0.1 * interval))  # Jitter to not align with scrapes
 
 def get_private_key(file_path):
     with open(file_path, 'r') as f:
-        lines = f.readlines()
-        for line in lines:
+        for line in f:
             if 'Private Key:' in line:
-                return line.split('Private Key:')[1].strip()
+                return line.partition('Private Key:')[2].strip()
     return None
 
 def get_wallet_address(file_path):
     with open(file_path, 'r') as f:
-        lines = f.readlines()
-        for line in lines:
+        for line in f:
             if 'Address:' in line:
-                return line.split('Address:')[1].strip()
+                return line.partition('Address:')[2].strip()
     return None
 
 def get_vote_key(file_path):
-    with open(file_path, 'r') as file:
-        lines = file.readlines()
-    for i in range(len(lines)):
-        if "Secret Key:" in lines[i]:
-            secret_key = lines[i+2].strip()  # The secret key is two lines down
-    return secret_key
+    with open(file_path, 'r') as f:
+        for line in f:
+            if "Secret Key:" in line:
+                next(f, None)
+                return next(f, '').strip()  # The secret key is two lines down
+    return None
+
+@functools.lru_cache(maxsize=None)
+def load_keys():
+    # The key files are static, parse them once and reuse the result.
+    # Files are read concurrently in case /keys lives on slow storage.
+    sigkey = EXECUTOR.submit(get_private_key, '/keys/signing_key.txt')
+    votekey = EXECUTOR.submit(get_vote_key, '/keys/vote_key.txt')
+    address_private = EXECUTOR.submit(get_private_key, '/keys/address.txt')
+    return Keys(
+        sigkey=sigkey.result(),
+        votekey=votekey.result(),
+        address_private=address_private.result(),
+    )
 
 def needs_funds(address):
     res = nimiq_request("getAccountByAddress", [address])
@@ -90,151 +282,246 @@ def get_address():
 
 def send_raw_tx(tx_hash):
     res = nimiq_request("sendRawTransaction", [tx_hash])
-    logging.info(f"Transaction: {res}")
+    log.info("Transaction: %s", res)
     if res is None:
         return None
     if 'error' in res:
-        logging.error(f"Error pushing transaction: {res['error']['message']}")
+        log.error("Error pushing transaction: %s", res['error']['message'])
         return None
-    logging.info(f"Transaction send: {res}")
+    log.info("Transaction send: %s", res)
 
 def get_epoch_number():
     res = nimiq_request("getEpochNumber")
     if res is None:
         return None
-    EPOCH_NUMBER.set(res['data'])
+    publish(epoch_number=res['data'])
 
 def is_validator_active(address):
     result = nimiq_request("getValidatorByAddress", [address])
     if result and 'data' in result:
-        VALIDATOR_ACTIVE.set(1 if not result['data']['retired'] else 0)
-        return not result['data']['retired']
+        # Publishes all validator metrics from the same response.
+        data = result['data']
+        retired = data.get('retired', False)
+        publish(validator_active=0 if retired else 1,
+                total_stake=data.get('balance', 0) / 1e5,  # Convert to NIM
+                current_stakers=data.get('numStakers', 0))
+        return not retired
     else:
         return False
 
-def set_balance_prometheus(address):
-    balance = get_balance(address)
-    if balance is not None:
-        balance = balance / 1e5  # Convert to NIM
-        CURRENT_BALANCE.set(balance)
-    else:
-        logging.error("Error getting balance.")
-    return balance
-
-def get_stake_by_address(address):
-    res = nimiq_request("getValidatorByAddress", [address])
-    if res is not None and 'data' in res:
-        balance = res['data'].get('balance', 0) / 1e5  # Convert to NIM
-        num_stakers = res['data'].get('numStakers', 0)
-        retired = res['data'].get('retired', False)
-        TOTAL_STAKE.set(balance)
-        CURRENT_STAKERS.set(num_stakers)
-    else:
-        logging.error("Error getting stake information.")
-    return balance, num_stakers, retired
-
 def get_balance(address):
     res = nimiq_request("getAccountByAddress", [address])
     if res is None:
         return None
     if 'error' in res:
-        logging.error(f"Error getting balance: {res['error']['message']}")
+        log.error("Error getting balance: %s", res['error']['message'])
         return None
     return res['data']['balance']
 
 def wait_for_enough_stake(ADDRESS):
+    backoff = {}
     while True:
         balance = get_balance(ADDRESS)
         if balance is not None:
             balance = balance / 1e5  # Convert to NIM
-            CURRENT_BALANCE.set(balance)
+            publish(current_balance=balance)
             if balance >= 100000:  # Check if balance is at least 100k NIM
-                logging.info(f"Balance reached: {balance} NIM.")
+                log.info("Balance reached: %s NIM.", balance)
                 break
             else:
-                logging.info(f"Current balance: {balance} NIM. Waiting for balance to reach 100k NIM.")
+                log.info("Current balance: %s NIM. Waiting for balance to reach 100k NIM.", balance)
         else:
-            logging.error("Error getting balance.")
-        time.sleep(60)  # Wait for 1 minute
+            log.error("Error getting balance.")
+        adaptive_sleep(backoff, balance)  # Back off while the balance does not change
 
-def monitor_active_validator(address):
+def poll_all(address):
+    # One getValidatorByAddress, one getEpochNumber and one getAccountByAddress per tick, in a single batch.
+    # Returns the metric values of the tick keyed like _SNAPSHOT, values the node did not return are left out.
+    validator, epoch, account = nimiq_request_batch([
+        ("getValidatorByAddress", [address]),
+        ("getEpochNumber", []),
+        ("getAccountByAddress", [address]),
+    ])
+    values = {}
+    if validator and 'data' in validator:
+        values['validator_active'] = 0 if validator['data'].get('retired', False) else 1
+        values['total_stake'] = validator['data'].get('balance', 0) / 1e5  # Convert to NIM
+        values['current_stakers'] = validator['data'].get('numStakers', 0)
+    if epoch and 'data' in epoch:
+        values['epoch_number'] = epoch['data']
+    if account is not None and 'data' in account:
+        values['current_balance'] = account['data']['balance'] / 1e5  # Convert to NIM
+    else:
+        log.error("Error getting balance.")
+    return values
+
+def update_validator_metrics(address):
+    # Refreshes all monitoring metrics, returns False once the validator is not active anymore.
+    values = poll_all(address)
+    publish(**values)
+    if values.get('validator_active') != 1:
+        return False
+    log.info("Validator still active, updating metrics.")
+    return True
+
+def subscribe_head_blocks():
+    ws = websocket.create_connection(NIMIQ_WS_URL, timeout=HEAD_BLOCK_TIMEOUT)
+    ws.send(orjson.dumps({
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "subscribeForHeadBlock",
+        "params": [False],
+    }))
+    # The first reply carries the subscription id, or an error if the node does not offer the subscription.
+    try:
+        ws.settimeout(REQUEST_TIMEOUT[1])
+        reply = orjson.loads(ws.recv())
+        if 'error' in reply:
+            raise websocket.WebSocketException(reply['error'].get('message', reply['error']))
+        ws.settimeout(HEAD_BLOCK_TIMEOUT)
+    except Exception:
+        ws.close()
+        raise
+    return ws
+
+def next_head_block(ws):
+    # Waits for the next head block notification and returns the block.
     while True:
-        if not is_validator_active(address):
-            logging.info("Validator not active anymore.")
-            break
-        else:
-            logging.info("Validator still active, updating metrics.")
-            get_epoch_number()
-            get_stake_by_address(address)
-            set_balance_prometheus(address)
-        time.sleep(30)
+        message = orjson.loads(ws.recv())
+        if message.get('method') != "subscribeForHeadBlock":
+            continue
+        block = message['params']['result']
+        if isinstance(block, dict):
+            block = block.get('data', block)
+        if not isinstance(block, dict):
+            raise ValueError(f"Unexpected head block notification: {message}")
+        return block
+
+def monitor_active_validator(address):
+    try:
+        ws = subscribe_head_blocks()
+    except (websocket.WebSocketException, OSError, ValueError) as err:
+        log.info("Head block subscription not available (%s), polling instead.", err)
+        return poll_active_validator(address)
+
+    try:
+        last_epoch = None
+        last_update = 0.0
+        while True:
+            try:
+                block = next_head_block(ws)
+            except (websocket.WebSocketException, OSError, ValueError, KeyError) as err:
+                log.error("Head block subscription lost (%s), polling instead.", err)
+                break
+            epoch = block.get('epoch')
+            if epoch is not None:
+                publish(epoch_number=epoch)
+            # Re-evaluate the validator on a new epoch, otherwise at most every MONITOR_INTERVAL seconds.
+            if epoch != last_epoch or time.monotonic() - last_update >= MONITOR_INTERVAL:
+                if not update_validator_metrics(address):
+                    log.info("Validator not active anymore.")
+                    return
+                last_epoch = epoch
+                last_update = time.monotonic()
+    finally:
+        ws.close()
+    return poll_active_validator(address)
+
+def poll_active_validator(address):
+    while update_validator_metrics(address):
+        time.sleep(MONITOR_INTERVAL)
+    log.info("Validator not active anymore.")
+
+def request_funds(address):
+    # The faucet is tried twice with a bounded timeout so a hung faucet can not block activation.
+    for _ in range(2):
+        try:
+            response = SESSION.post(FACUET_URL, data={'address': address}, timeout=FAUCET_TIMEOUT)
+        except requests.exceptions.RequestException as err:
+            log.error("Faucet request failed: %s", err)
+            continue
+        log.info("Faucet responded with status %s.", response.status_code)
+        if response.status_code < 500:
+            # Only server errors are retried, a 4xx such as a rate limit would fail again.
+            return response.ok
+    return False
 
 def activate_validator(ADDRESS):
-    logging.info(f"Address: {ADDRESS}")   
-    SIGKEY = get_private_key('/keys/signing_key.txt')
-    VOTEKEY = get_vote_key('/keys/vote_key.txt')
-    ADDRESS_PRIVATE = get_private_key('/keys/address.txt')
+    log.info("Address: %s", ADDRESS)
+    keys = load_keys()
 
     if NIMIQ_NETWORK == 'testnet':
-        logging.info("Funding Nimiq address.")
+        log.info("Funding Nimiq address.")
         if needs_funds(ADDRESS):
-            requests.post(FACUET_URL, data={'address': ADDRESS})
+            if not request_funds(ADDRESS):
+                log.error("Faucet did not fund the address, waiting for funds anyway.")
         else:
-            logging.info("Address already funded.")
+            log.info("Address already funded.")
 
-    logging.info("Importing private key.")
-    nimiq_request("importRawKey", [ADDRESS_PRIVATE, ''])
+    log.info("Importing private key.")
+    nimiq_request("importRawKey", [keys.address_private, ''])
 
-    logging.info("Unlock Account.")
+    log.info("Unlock Account.")
     nimiq_request("unlockAccount", [ADDRESS, '', 0])
     
-    logging.info("Wait for enough stake.")
+    log.info("Wait for enough stake.")
     wait_for_enough_stake(ADDRESS)
 
-    logging.info("Activate Validator")
-    result = nimiq_request("createNewValidatorTransaction", [ADDRESS, ADDRESS, SIGKEY, VOTEKEY, ADDRESS, "", 500, "+0"])
+    log.info("Activate Validator")
+    result = nimiq_request("createNewValidatorTransaction", [ADDRESS, ADDRESS, keys.sigkey, keys.votekey, ADDRESS, "", 500, "+0"])
     
-    logging.info("Sending Transaction")
+    log.info("Sending Transaction")
     send_raw_tx(result.get('data'))
 
-    ACTIVATED_AMOUNT.labels(address=ADDRESS).inc()
+    publish_activation(ADDRESS)
     return True
 
 def check_and_activate_validator(address):
     if is_validator_active(address):
-        logging.info("Validator already active.")
+        log.info("Validator already active.")
         monitor_active_validator(address)
     else:
-        logging.info("Validator not active.")
+        log.info("Validator not active.")
         activate_validator(address)
 
 def check_consensus():
-    logging.info("Waiting for consensus to be established, this may take a while...")
+    log.info("Waiting for consensus to be established, this may take a while...")
     consensus_count = 0
-    while consensus_count < 3:
-        res = nimiq_request("isConsensusEstablished")
+    backoff = {}
+    while True:
+        try:
+            res = nimiq_request("isConsensusEstablished")
+        except ConsensusLost:
+            res = None
         if res is not None and res.get('data') == True:
             consensus_count += 1
-            logging.debug(f"Consensus established {consensus_count} time(s).")
+            log.debug("Consensus established %s time(s).", consensus_count)
         else:
             consensus_count = 0
-            logging.debug("Consensus not established yet.")
-        time.sleep(5)
-    logging.info("Consensus established.")
+            log.debug("Consensus not established yet.")
+        if consensus_count >= CONSENSUS_CONFIRMATIONS:
+            break
+        adaptive_sleep(backoff, consensus_count, floor=CONSENSUS_INTERVAL, ceiling=30)  # Back off while the count does not move
+    log.info("Consensus established.")
     return True
 
 if __name__ == '__main__':
-    logging.info("Starting validator monitoring script...")
-    logging.info(f"Version: 0.3.0 ")
+    log.info("Starting validator monitoring script...")
+    log.info("Version: 0.3.0 ")
     start_http_server(int(PROMETHEUS_PORT))  # Start Prometheus client
+    try:
+        load_keys()
+    except OSError as err:
+        log.error("Could not read key files: %s", err)
     address = get_address()
-    ACTIVATED_AMOUNT.labels(address=address).set(0)
-    TOTAL_STAKE.set(0)
-    CURRENT_STAKERS.set(0)
-    CURRENT_BALANCE.set(0)
-    VALIDATOR_ACTIVE.set(0)
+    publish(activated_amount={address: 0})
+    check_consensus()
     while True:
-        if check_consensus():
+        try:
             get_epoch_number()
             check_and_activate_validator(address)
-        time.sleep(30)  # Wait for 10 minutes to check again.
+        except ConsensusLost as err:
+            # Only probe consensus again when the node reports it is out of sync.
+            log.info("Consensus lost: %s", err)
+            check_consensus()
+        time.sleep(30)  # Wait for 30 seconds to check again.